@@ -365,7 +365,9 @@ class OpenCVCamera(Camera):
         if not self.is_connected:
             raise DeviceNotConnectedError(f"{self} is not connected.")
 
-        start_time = time.perf_counter()
+        log_read_duration = logger.isEnabledFor(logging.DEBUG)
+        if log_read_duration:
+            start_time = time.perf_counter()
 
         if self.videocapture is None:
             raise DeviceNotConnectedError(f"{self} videocapture is not initialized")
@@ -377,8 +379,9 @@ class OpenCVCamera(Camera):
 
         processed_frame = self._postprocess_image(frame, color_mode)
 
-        read_duration_ms = (time.perf_counter() - start_time) * 1e3
-        logger.debug(f"{self} read took: {read_duration_ms:.1f}ms")
+        if log_read_duration:
+            read_duration_ms = (time.perf_counter() - start_time) * 1e3
+            logger.debug(f"{self} read took: {read_duration_ms:.1f}ms")
 
         return processed_frame
 
@@ -158,7 +158,9 @@ class Reachy2Camera(Camera):
         if not self.is_connected:
             raise DeviceNotConnectedError(f"{self} is not connected.")
 
-        start_time = time.perf_counter()
+        log_read_duration = logger.isEnabledFor(logging.DEBUG)
+        if log_read_duration:
+            start_time = time.perf_counter()
 
         frame: NDArray[Any] = np.empty((0, 0, 3), dtype=np.uint8)
 
@@ -182,8 +184,9 @@ class Reachy2Camera(Camera):
             if self.config.color_mode == "rgb":
                 frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
 
-        read_duration_ms = (time.perf_counter() - start_time) * 1e3
-        logger.debug(f"{self} read took: {read_duration_ms:.1f}ms")
+        if log_read_duration:
+            read_duration_ms = (time.perf_counter() - start_time) * 1e3
+            logger.debug(f"{self} read took: {read_duration_ms:.1f}ms")
 
         return frame
 
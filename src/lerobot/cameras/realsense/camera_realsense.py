@@ -338,7 +338,9 @@ class RealSenseCamera(Camera):
                 f"Failed to capture depth frame '.read_depth()'. Depth stream is not enabled for {self}."
             )
 
-        start_time = time.perf_counter()
+        log_read_duration = logger.isEnabledFor(logging.DEBUG)
+        if log_read_duration:
+            start_time = time.perf_counter()
 
         if self.rs_pipeline is None:
             raise RuntimeError(f"{self}: rs_pipeline must be initialized before use.")
@@ -353,8 +355,9 @@ class RealSenseCamera(Camera):
 
         depth_map_processed = self._postprocess_image(depth_map, depth_frame=True)
 
-        read_duration_ms = (time.perf_counter() - start_time) * 1e3
-        logger.debug(f"{self} read took: {read_duration_ms:.1f}ms")
+        if log_read_duration:
+            read_duration_ms = (time.perf_counter() - start_time) * 1e3
+            logger.debug(f"{self} read took: {read_duration_ms:.1f}ms")
 
         return depth_map_processed
 
@@ -381,7 +384,9 @@ class RealSenseCamera(Camera):
         if not self.is_connected:
             raise DeviceNotConnectedError(f"{self} is not connected.")
 
-        start_time = time.perf_counter()
+        log_read_duration = logger.isEnabledFor(logging.DEBUG)
+        if log_read_duration:
+            start_time = time.perf_counter()
 
         if self.rs_pipeline is None:
             raise RuntimeError(f"{self}: rs_pipeline must be initialized before use.")
@@ -396,8 +401,9 @@ class RealSenseCamera(Camera):
 
         color_image_processed = self._postprocess_image(color_image_raw, color_mode)
 
-        read_duration_ms = (time.perf_counter() - start_time) * 1e3
-        logger.debug(f"{self} read took: {read_duration_ms:.1f}ms")
+        if log_read_duration:
+            read_duration_ms = (time.perf_counter() - start_time) * 1e3
+            logger.debug(f"{self} read took: {read_duration_ms:.1f}ms")
 
         return color_image_processed
 